@@ -0,0 +1,169 @@
+"""Micro-benchmarks for the recorder's hot paths.
+
+Times each hot path on synthetic frames at several resolutions and compares
+against a stored baseline:
+
+    python benchmarks/bench_hotpaths.py --save-baseline   # record a baseline on this machine
+    python benchmarks/bench_hotpaths.py                   # compare, exit 1 on regression
+
+Each case runs in batches long enough to time reliably, and the best of several
+rounds is kept, so scheduler noise only ever makes a round slower. A case
+regresses when its best time per call or its peak allocation grows by more
+than --threshold (default 15%) over the baseline plus a small absolute slack.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import screenrecord  # noqa: E402
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+RESOLUTIONS = [(1280, 720), (1920, 1080), (3840, 2160)]
+PREVIEW_SIZE = (400, 225)
+ALLOC_SLACK = 4096  # Bytes of peak-allocation jitter tolerated regardless of threshold
+TIME_SLACK_MS = 0.05  # Timing jitter tolerated regardless of threshold, for microsecond-level cases
+ROUNDS = 7
+MIN_ROUND_SECONDS = 0.05  # Calls are batched until one round takes at least this long
+
+
+def synthetic_bgra(width, height):
+    """Return a screen-like BGRA frame built from the recorder's probe frames."""
+    bgr = screenrecord.make_synthetic_frames(width, height, count=1)[0]
+    return np.dstack([bgr, np.full((height, width), 255, dtype=np.uint8)])
+
+
+def time_batch(func, batch):
+    """Return the nanoseconds taken by batch back-to-back calls of func."""
+    start = time.perf_counter_ns()
+    for _ in range(batch):
+        func()
+    return time.perf_counter_ns() - start
+
+
+def measure(func, rounds=ROUNDS, warmup=3):
+    """Return (best ms per call over several batched rounds, peak bytes allocated by one call)."""
+    for _ in range(warmup):
+        func()
+    batch = 1
+    while time_batch(func, batch) < MIN_ROUND_SECONDS * 1e9 and batch < 1_000_000:
+        batch *= 2
+    best = min(time_batch(func, batch) for _ in range(rounds)) / batch
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return best / 1e6, max(0, peak)
+
+
+def frame_cases(width, height, tmp_dir, photo_root):
+    """Yield (name, callable) for every per-frame hot path at one resolution."""
+    bgra = synthetic_bgra(width, height)
+    bgr = screenrecord.screenshot_to_bgr(bgra)
+
+    yield "bgra_to_bgr", lambda: screenrecord.screenshot_to_bgr(bgra)
+    yield "cursor_overlay", lambda: screenrecord.draw_cursor(bgr, width // 2, height // 2)
+
+    writer = screenrecord.open_video_writer(tmp_dir / f"bench_{width}x{height}.mp4", 30, (width, height))
+    if writer.isOpened():
+        yield "frame_write", lambda: writer.write(bgr)
+    share_size = screenrecord.rendition_size((width, height), 720)
+    yield "rendition_downscale", lambda: screenrecord.cv2.resize(
+        bgr, share_size, interpolation=screenrecord.cv2.INTER_AREA)
+
+    yield "preview_resize", lambda: screenrecord.make_preview_image(bgra, PREVIEW_SIZE)
+    if photo_root is not None:
+        image = screenrecord.make_preview_image(bgra, PREVIEW_SIZE)
+        yield "preview_photoimage", lambda: screenrecord.ImageTk.PhotoImage(image, master=photo_root)
+    writer.release()
+
+
+def startup_cases(tmp_dir):
+    """Yield (name, callable) for startup paths that do not depend on resolution."""
+    screenrecord.CONFIG_FILE = tmp_dir / "config.json"
+    screenrecord.save_config(tmp_dir, False, None, 0, True)
+    yield "get_monitors", screenrecord.get_monitors
+    yield "load_config", screenrecord.load_config
+
+
+def run_benchmarks():
+    """Run every case and return {case_key: {"ms": ..., "peak_kb": ...}}."""
+    results = {}
+    try:
+        photo_root = screenrecord.tk.Tk()
+        photo_root.withdraw()
+    except screenrecord.tk.TclError as e:
+        print(f"[-] No display for Tk, skipping PhotoImage benchmark: {e}")
+        photo_root = None
+    with tempfile.TemporaryDirectory(prefix="screen_recorder_bench_") as tmp:
+        tmp_dir = Path(tmp)
+        for width, height in RESOLUTIONS:
+            for name, func in frame_cases(width, height, tmp_dir, photo_root):
+                ms, peak = measure(func)
+                results[f"{name}@{width}x{height}"] = {"ms": round(ms, 4), "peak_kb": round(peak / 1024, 1)}
+        for name, func in startup_cases(tmp_dir):
+            ms, peak = measure(func)
+            results[name] = {"ms": round(ms, 4), "peak_kb": round(peak / 1024, 1)}
+    if photo_root is not None:
+        photo_root.destroy()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table and return the list of regressed case keys."""
+    regressions = []
+    print(f"{'case':<34}{'ms':>10}{'base ms':>10}{'peak KB':>12}{'base KB':>12}")
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<34}{current['ms']:>10.3f}{'-':>10}{current['peak_kb']:>12.1f}{'-':>12}  (new)")
+            continue
+        slow = current["ms"] > base["ms"] * (1 + threshold) + TIME_SLACK_MS
+        heavy = current["peak_kb"] * 1024 > base["peak_kb"] * 1024 * (1 + threshold) + ALLOC_SLACK
+        flag = "  REGRESSED" if slow or heavy else ""
+        print(f"{key:<34}{current['ms']:>10.3f}{base['ms']:>10.3f}{current['peak_kb']:>12.1f}{base['peak_kb']:>12.1f}{flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the screen recorder's hot paths.")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed fractional regression (default 0.15)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="baseline JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": platform.node(), "python": platform.python_version(), "results": results}, f, indent=2)
+        print(f"[+] Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        compare(results, {}, args.threshold)
+        print(f"[-] No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    if baseline.get("machine") != platform.node():
+        print(f"[-] Baseline was recorded on {baseline.get('machine')}, comparisons may be meaningless")
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    if regressions:
+        print(f"[-] {len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("[+] No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,22 +5,27 @@ import cv2
 import numpy as np
 import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from collections import deque
 from pathlib import Path
 import keyboard
 import os
 import json
+import re
 import subprocess
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+import ctypes
 import glob
+import shutil
+import tempfile
 import pystray
 from PIL import Image, ImageDraw, ImageTk
 import mss
 
-# Print available monitors for debugging
-with mss.mss() as sct:
-    for i, mon in enumerate(sct.monitors[1:], 1):
-        print(f"Screen {i}: {mon['width']}x{mon['height']} at ({mon['left']},{mon['top']})")
-
 # Global control variables
 is_recording = False
 stop_flag = False
@@ -36,6 +41,39 @@ save_path = Path.home() / "Videos" / "Python Videos"
 last_recorded_file = None
 hotkey = 'ctrl+shift+r'
 window_toggle_key = 'f12'
+encoder_probe = {}
+probe_lock = threading.Lock()
+DEFAULT_ENCODER = ("opencv", "mp4v")
+OPENCV_FOURCCS = ["mp4v", "avc1", "XVID", "MJPG"]
+X264_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium"]
+PROBE_FRAMES = 90
+PROBE_TIME_LIMIT = 3.0
+PROBE_HEADROOM = 1.2  # Encoder must beat the target fps by 20% to count as sustaining it
+PROBE_BUCKETS = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+ui_events = deque()  # Engine-to-UI events; deque append/popleft are atomic, so workers never block on Tk
+UI_DRAIN_INTERVAL_MS = 50
+HIDE_SETTLE_MS = 150  # Delay after withdraw() before capture may start
+HIDE_WAIT_TIMEOUT = 2.0
+COALESCED_EVENTS = ("status", "stats", "preview")
+STATS_INTERVAL = 0.5
+hud_window = None
+hud_label = None
+output_mode = "file"  # "file" writes a single MP4, "hls" writes a rolling live playlist
+hls_segment_seconds = 2
+hls_window_segments = 6
+hls_keep_all = False  # Keep every segment and list them all instead of only the rolling live window
+renditions_enabled = False
+DEFAULT_RENDITIONS = [{"name": "share", "height": 720, "max_bitrate": "4M"}]
+renditions = DEFAULT_RENDITIONS
+capture_process = False  # Run capture and encode in child processes instead of a thread
+RING_MAX_SLOTS = 8
+RING_BYTES_BUDGET = 256 * 1024 * 1024
+PROCESS_START_TIMEOUT = 30
+follow_cursor = False  # Record a smaller viewport that pans after the cursor
+follow_size = (1280, 720)
+follow_dead_zone = 0.3
+follow_easing = 0.15
+jobs_running = False
 
 def get_monitors():
     """Retrieve list of monitors using mss."""
@@ -51,6 +89,118 @@ def get_monitors():
         print(f"[-] Error getting screens: {e}")
         return []
 
+def post_ui(kind, value=None):
+    """Queue an engine-to-UI event. Safe to call from any thread; never touches Tk directly."""
+    ui_events.append((kind, value))
+
+def hide_window_and_wait():
+    """Ask the Tk thread to hide the main window and block until it is off screen, so the first grab misses it."""
+    hidden = threading.Event()
+    post_ui("hide_window", hidden)
+    if not hidden.wait(HIDE_WAIT_TIMEOUT):
+        print("[-] Timed out waiting for the window to hide")
+
+def drain_ui_events():
+    """Apply queued UI events on the Tk thread, keeping only the latest status, stats and preview frame."""
+    latest = {}
+    actions = []
+    while True:
+        try:
+            kind, value = ui_events.popleft()
+        except IndexError:
+            break
+        if kind in COALESCED_EVENTS:
+            latest[kind] = value
+        else:
+            actions.append((kind, value))
+    for kind, value in actions:
+        try:
+            if kind == "hide_window":
+                root.withdraw()
+                # Give the compositor time to take the window off screen before capture starts
+                root.after(HIDE_SETTLE_MS, value.set)
+            elif kind == "restore_window":
+                root.deiconify()
+                root.state('normal')
+                root.lift()
+            elif kind == "hud_show":
+                show_hud()
+            elif kind == "hud_hide":
+                hide_hud()
+            elif kind == "preview_stop" and value is preview_window:
+                stop_preview()
+        except Exception as e:
+            print(f"[-] Error handling UI event {kind}: {e}")
+    try:
+        if "status" in latest:
+            status_label.config(text=latest["status"])
+        if "stats" in latest:
+            update_hud(latest["stats"])
+        if "preview" in latest:
+            label, image, text = latest["preview"]
+            if is_previewing and label.winfo_exists():
+                if image is not None:
+                    photo = ImageTk.PhotoImage(image)
+                    label.config(image=photo, text=text)
+                    label.image = photo
+                else:
+                    label.config(text=text)
+    except Exception as e:
+        print(f"[-] Error updating UI: {e}")
+    root.after(UI_DRAIN_INTERVAL_MS, drain_ui_events)
+
+def show_hud():
+    """Show the small always-on-top recording HUD."""
+    global hud_window, hud_label
+    if hud_window is not None and hud_window.winfo_exists():
+        return
+    hud_window = tk.Toplevel(root)
+    hud_window.overrideredirect(True)
+    hud_window.attributes('-topmost', True)
+    hud_window.attributes('-alpha', 0.8)
+    hud_label = tk.Label(hud_window, text="● REC 00:00", fg='white', bg='darkred',
+                         font=('Consolas', 9, 'bold'), padx=6, pady=2)
+    hud_label.pack()
+    hud_window.update_idletasks()
+    hud_window.geometry(f"+{root.winfo_screenwidth() - 300}+10")
+    try:
+        # WDA_EXCLUDEFROMCAPTURE keeps the HUD out of the recording on Windows 10 2004+
+        hwnd = ctypes.windll.user32.GetParent(hud_window.winfo_id())
+        ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, 0x11)
+    except Exception as e:
+        print(f"[-] HUD may appear in recordings: {e}")
+
+def hide_hud():
+    """Hide the recording HUD."""
+    global hud_window, hud_label
+    if hud_window is not None and hud_window.winfo_exists():
+        hud_window.destroy()
+    hud_window = hud_label = None
+
+def update_hud(stats):
+    """Refresh the HUD with elapsed time, live fps, dropped frames and file size."""
+    if hud_label is None or not hud_label.winfo_exists():
+        return
+    minutes, seconds = divmod(int(stats["elapsed"]), 60)
+    hud_label.config(text=f"● REC {minutes:02d}:{seconds:02d} | {stats['fps']:.1f} fps | "
+                          f"{stats['drops']} drops | {stats['size'] / 1048576:.1f} MB")
+
+def screenshot_to_bgr(img, dst=None):
+    """Convert an mss screenshot (or BGRA array) to a BGR frame, optionally into a preallocated dst."""
+    return cv2.cvtColor(np.asarray(img), cv2.COLOR_BGRA2BGR, dst=dst)
+
+def draw_cursor(frame, rel_x, rel_y):
+    """Draw the cursor marker onto a BGR frame at frame-relative coordinates, if inside it."""
+    height, width = frame.shape[:2]
+    if 0 <= rel_x < width and 0 <= rel_y < height:
+        cv2.circle(frame, (rel_x, rel_y), 5, (0, 0, 0), 1)
+        cv2.circle(frame, (rel_x, rel_y), 3, (255, 255, 255), -1)
+
+def make_preview_image(frame, size):
+    """Convert a BGRA capture to a resized RGB PIL image for the preview window."""
+    image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB))
+    return image.resize(size, Image.Resampling.LANCZOS)
+
 def stop_preview():
     """Stop the preview window and thread."""
     global is_previewing, preview_thread, preview_window
@@ -122,55 +272,44 @@ def start_preview():
     preview_label = tk.Label(preview_window)
     preview_label.pack(fill='both', expand=True)
     is_previewing = True
+    window = preview_window
     def update_preview():
         try:
             with mss.mss() as sct:
-                target_fps = 30
+                target_fps = 1000 // UI_DRAIN_INTERVAL_MS  # Frames beyond the UI drain rate would only be coalesced away
                 frame_interval = 1.0 / target_fps
-                while is_previewing and preview_window.winfo_exists():
+                while is_previewing and preview_window is window:
                     start_time = time.time()
                     try:
                         img = sct.grab(mon)
                         if img is None or img.rgb is None:
                             print("[-] Failed to capture frame: Empty image")
-                            preview_window.after(0, lambda: preview_label.config(text="Error: Failed to capture frame"))
+                            post_ui("preview", (preview_label, None, "Error: Failed to capture frame"))
                             time.sleep(0.1)
                             continue
                         frame = np.array(img)
                         if frame.size == 0:
                             print("[-] Empty frame captured")
-                            preview_window.after(0, lambda: preview_label.config(text="Error: Empty frame"))
+                            post_ui("preview", (preview_label, None, "Error: Empty frame"))
                             time.sleep(0.1)
                             continue
-                        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
-                        image = Image.fromarray(frame)
-                        image = image.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(image)
-                        def update_label():
-                            if is_previewing and preview_window.winfo_exists():
-                                preview_label.config(image=photo, text="")
-                                preview_label.image = photo
-                            else:
-                                print("[-] Preview window closed or preview stopped")
-                        preview_window.after(0, update_label)
+                        image = make_preview_image(frame, (preview_width, preview_height))
+                        post_ui("preview", (preview_label, image, ""))
                         elapsed = time.time() - start_time
                         sleep_time = max(0, frame_interval - elapsed)
                         time.sleep(sleep_time)
                     except Exception as e:
                         error_msg = str(e)
                         print(f"[-] Preview frame error: {e}")
-                        preview_window.after(0, lambda msg=error_msg: preview_label.config(text=f"Error: {msg}"))
+                        post_ui("preview", (preview_label, None, f"Error: {error_msg}"))
                         time.sleep(0.1)
         except Exception as e:
             error_msg = str(e)
             print(f"[-] Preview loop error: {e}")
-            preview_window.after(0, lambda msg=error_msg: preview_label.config(text=f"Error: {msg}"))
+            post_ui("preview", (preview_label, None, f"Error: {error_msg}"))
         finally:
-            # global is_previewing
-            # is_previewing = False
             print("[+] Preview thread stopped")
-            if preview_window.winfo_exists():
-                preview_window.after(0, preview_window.destroy)
+            post_ui("preview_stop", window)
     preview_thread = threading.Thread(target=update_preview, daemon=True)
     preview_thread.start()
     print("[+] Preview started")
@@ -207,21 +346,261 @@ def get_video_duration(path):
         print(f"[-] Error getting video duration: {e}")
         return 10.0
 
-def save_config(path, replace_mode, record_region, selected_monitor, show_cursor):
-    """Save configuration to JSON file."""
-    config = {
-        "save_path": str(path),
-        "replace_mode": replace_mode,
-        "record_region": record_region,
-        "selected_monitor": selected_monitor,
-        "show_cursor": show_cursor
+class FFmpegWriter:
+    """cv2.VideoWriter-compatible writer that pipes raw BGR frames into an ffmpeg libx264 encoder."""
+    def __init__(self, path, fps, size, preset="veryfast", output_args=None, input_args=None):
+        width, height = size
+        ffmpeg_cmd = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            *(input_args or []),
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-vcodec", "libx264", "-preset", preset, "-pix_fmt", "yuv420p",
+            *(output_args or []),
+            str(path)
+        ]
+        try:
+            self.proc = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE)
+        except Exception as e:
+            print(f"[-] Error starting ffmpeg writer: {e}")
+            self.proc = None
+
+    def isOpened(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def write(self, frame):
+        self.proc.stdin.write(np.ascontiguousarray(frame).data)
+
+    def release(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except Exception as e:
+            print(f"[-] Error closing ffmpeg writer: {e}")
+        self.proc.wait()
+        self.proc = None
+
+def open_video_writer(path, fps, size, backend=DEFAULT_ENCODER):
+    """Open a video writer for an encoder backend such as ("opencv", "mp4v") or ("ffmpeg", "veryfast")."""
+    kind, option = backend
+    if kind == "ffmpeg":
+        return FFmpegWriter(path, fps, size, preset=option)
+    return cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*option), fps, size)
+
+def open_hls_writer(playlist_path, fps, size, preset):
+    """Open an ffmpeg writer that emits a rolling HLS playlist and segments as frames arrive.
+
+    With hls_keep_all the playlist lists every segment and none are deleted, so the whole session survives.
+    """
+    gop = max(1, round(fps * hls_segment_seconds))
+    delete_flag = "" if hls_keep_all else "delete_segments+"
+    output_args = [
+        "-tune", "zerolatency",
+        "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",  # Keyframe at every segment boundary
+        "-f", "hls",
+        "-hls_time", str(hls_segment_seconds),
+        "-hls_list_size", "0" if hls_keep_all else str(hls_window_segments),
+        "-hls_flags", f"{delete_flag}independent_segments+temp_file",
+        "-hls_segment_filename", str(playlist_path.with_name("segment_%05d.ts"))
+    ]
+    return FFmpegWriter(playlist_path, fps, size, preset=preset, output_args=output_args)
+
+def rendition_size(size, target_height):
+    """Scale (width, height) down to target_height keeping aspect ratio and even dimensions."""
+    width, height = size
+    if height <= target_height:
+        return width, height
+    return max(2, round(width * target_height / height / 2) * 2), target_height
+
+def open_renditions(stem, fps, size, probe):
+    """Open one extra writer per configured rendition. Returns a list of (writer, size, path).
+
+    Renditions come from load_rendition_settings, which has already validated name, height and max_bitrate.
+    """
+    opened = []
+    live_preset = live_x264_preset(probe)
+    try:
+        for rendition in renditions:
+            target_size = rendition_size(size, rendition["height"])
+            path = save_path / f"{stem}_{rendition['name']}.mp4"
+            if live_preset is not None:
+                # Encode straight to the Twitter profile so the share copy needs no second pass
+                max_bitrate = rendition["max_bitrate"]
+                writer = FFmpegWriter(path, fps, target_size, preset=live_preset,
+                                      input_args=["-f", "lavfi", "-i", "anullsrc=channel_layout=stereo:sample_rate=44100"],
+                                      # No -level: x264 derives it from the rendition's size and fps
+                                      output_args=["-profile:v", "baseline",
+                                                   "-maxrate", max_bitrate, "-bufsize", max_bitrate,
+                                                   "-acodec", "aac", "-b:a", "128k", "-shortest"])
+            else:
+                print(f"[-] ffmpeg with libx264 not found, rendition {path.name} uses OpenCV without a bitrate cap")
+                writer = open_video_writer(path, fps, target_size, tuple(probe["recorder"]))
+            if not writer.isOpened():
+                print(f"[-] Failed to open rendition {path.name}")
+                continue
+            print(f"[+] Rendition {path.name}: {target_size[0]}x{target_size[1]}")
+            opened.append((writer, target_size, path))
+    except Exception:
+        # Do not leak the writers (and ffmpeg processes) that did open
+        for writer, _, _ in opened:
+            writer.release()
+        raise
+    return opened
+
+def write_renditions(opened, frame):
+    """Downscale one captured BGR frame once per rendition and write it."""
+    height, width = frame.shape[:2]
+    for writer, target_size, _ in opened:
+        if target_size == (width, height):
+            writer.write(frame)
+        else:
+            writer.write(cv2.resize(frame, target_size, interpolation=cv2.INTER_AREA))
+
+def live_x264_preset(entry):
+    """Return the cheapest x264 preset from a probe entry that sustains live encoding, or None without libx264."""
+    x264_results = [r for r in entry["results"] if r["backend"][0] == "ffmpeg"]
+    if not x264_results:
+        return None
+    return max(x264_results, key=lambda r: r["fps"])["backend"][1]
+
+def available_encoders():
+    """List encoder backends that can be probed on this machine."""
+    encoders = [("opencv", fourcc) for fourcc in OPENCV_FOURCCS]
+    if shutil.which("ffmpeg"):
+        try:
+            result = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            if "libx264" in result.stdout:
+                encoders += [("ffmpeg", preset) for preset in X264_PRESETS]
+        except Exception as e:
+            print(f"[-] Error listing ffmpeg encoders: {e}")
+    return encoders
+
+def make_synthetic_frames(width, height, count=4):
+    """Build screen-like test frames: a scrolling gradient with a noisy, changing block."""
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 255, width, dtype=np.uint8)
+    base = np.empty((height, width, 3), dtype=np.uint8)
+    base[:] = gradient[None, :, None]
+    frames = []
+    block_h, block_w = max(1, height // 4), max(1, width // 4)
+    for i in range(count):
+        frame = np.roll(base, i * 8, axis=1)
+        top, left = (i * block_h // 2) % (height - block_h + 1), (i * block_w // 2) % (width - block_w + 1)
+        frame[top:top + block_h, left:left + block_w] = rng.integers(0, 256, (block_h, block_w, 3), dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+def benchmark_encoder(backend, frames, fps):
+    """Return the frames per second an encoder backend sustains on synthetic frames, or None if unusable."""
+    height, width = frames[0].shape[:2]
+    tmp_dir = Path(tempfile.mkdtemp(prefix="screen_recorder_probe_"))
+    path = tmp_dir / "probe.mp4"
+    try:
+        writer = open_video_writer(path, fps, (width, height), backend)
+        if not writer.isOpened():
+            return None
+        written = 0
+        start_time = time.perf_counter()
+        while written < PROBE_FRAMES and time.perf_counter() - start_time < PROBE_TIME_LIMIT:
+            writer.write(frames[written % len(frames)])
+            written += 1
+        writer.release()
+        elapsed = time.perf_counter() - start_time
+        if written == 0 or not path.exists() or path.stat().st_size == 0:
+            return None
+        return written / elapsed
+    except Exception as e:
+        print(f"[-] Encoder {backend[0]}:{backend[1]} failed: {e}")
+        return None
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def probe_bucket(width, height, fps):
+    """Map a capture size and fps to the (width, height, fps) bucket whose probe covers it.
+
+    Buckets round the pixel count up to the next standard resolution and fps up to a multiple
+    of 30, so nearby regions and viewports share one probe and the result errs on the safe side.
+    """
+    bucket_width, bucket_height = next((bucket for bucket in PROBE_BUCKETS if bucket[0] * bucket[1] >= width * height),
+                                       PROBE_BUCKETS[-1])
+    return bucket_width, bucket_height, max(30, -(-fps // 30) * 30)
+
+def probe_key(width, height, fps):
+    """Return the encoder_probe cache key for a capture size and fps."""
+    return "{}x{}@{}".format(*probe_bucket(width, height, fps))
+
+def probe_encoders(width, height, fps, should_stop=None):
+    """Benchmark every available encoder at the given size and fps and cache the result.
+
+    Returns None without caching if should_stop() becomes true between backends.
+    """
+    print(f"[+] Probing encoders at {width}x{height}@{fps}...")
+    frames = make_synthetic_frames(width, height)
+    results = []
+    for backend in available_encoders():
+        if should_stop is not None and should_stop():
+            print("[-] Encoder probe interrupted")
+            return None
+        measured = benchmark_encoder(backend, frames, fps)
+        if measured is None:
+            print(f"[-] Encoder {backend[0]}:{backend[1]} unavailable")
+            continue
+        print(f"[+] Encoder {backend[0]}:{backend[1]}: {measured:.1f} fps")
+        results.append({"backend": list(backend), "fps": round(measured, 1)})
+    sustaining = [r for r in results if r["fps"] >= fps * PROBE_HEADROOM]
+    # Cheapest = least time per frame; fall back to the fastest encoder if none keeps up
+    recorder = max(sustaining or results, key=lambda r: r["fps"])["backend"] if results else list(DEFAULT_ENCODER)
+    entry = {
+        "results": results,
+        "recorder": recorder,
+        "probed_at": datetime.now().isoformat(timespec="seconds")
     }
+    encoder_probe[probe_key(width, height, fps)] = entry
+    update_config(encoder_probe=encoder_probe)
+    print(f"[+] Selected encoder {recorder[0]}:{recorder[1]}")
+    return entry
+
+def select_encoder(width, height, fps, should_stop=None):
+    """Return the cached probe entry covering this size and fps, probing its bucket on first use.
+
+    Returns None if should_stop() interrupts the probe.
+    """
+    with probe_lock:
+        entry = encoder_probe.get(probe_key(width, height, fps))
+        if entry is None:
+            entry = probe_encoders(*probe_bucket(width, height, fps), should_stop=should_stop)
+        return entry
+
+def read_config_file():
+    """Read the raw configuration dictionary, or an empty one if missing or unreadable."""
+    if CONFIG_FILE.exists():
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[-] Error reading config: {e}")
+    return {}
+
+def update_config(**values):
+    """Merge the given keys into the JSON config file, keeping all other keys."""
+    config = read_config_file()
+    config.update(values)
     try:
         with open(CONFIG_FILE, "w") as f:
             json.dump(config, f)
-        print("[+] Configuration saved")
+        return True
     except Exception as e:
         print(f"[-] Error saving config: {e}")
+        return False
+
+def save_config(path, replace_mode, record_region, selected_monitor, show_cursor):
+    """Save configuration to JSON file."""
+    if update_config(save_path=str(path), replace_mode=replace_mode, record_region=record_region,
+                     selected_monitor=selected_monitor, show_cursor=show_cursor):
+        print("[+] Configuration saved")
 
 def load_config():
     """Load configuration from JSON file."""
@@ -246,14 +625,80 @@ def load_config():
             print(f"[-] Error loading config: {e}")
     return default_path, False, None, None, True
 
+def load_encoder_probe():
+    """Load cached encoder probe results from the config file."""
+    probe = read_config_file().get("encoder_probe", {})
+    return probe if isinstance(probe, dict) else {}
+
+def load_output_settings():
+    """Load output mode, HLS segment settings and whether all HLS segments are kept from the config file."""
+    config = read_config_file()
+    mode = config.get("output_mode", "file")
+    if mode not in ("file", "hls"):
+        mode = "file"
+    try:
+        segment_seconds = max(1, int(config.get("hls_segment_seconds", 2)))
+        window_segments = max(1, int(config.get("hls_window_segments", 6)))
+    except (TypeError, ValueError) as e:
+        print(f"[-] Invalid HLS settings in config, using defaults: {e}")
+        segment_seconds, window_segments = 2, 6
+    return mode, segment_seconds, window_segments, bool(config.get("hls_keep_all", False))
+
+def load_rendition_settings():
+    """Load whether extra renditions are recorded and their definitions from the config file."""
+    config = read_config_file()
+    configured = config.get("renditions", DEFAULT_RENDITIONS)
+    if not isinstance(configured, list) or not all(isinstance(r, dict) for r in configured):
+        print("[-] Invalid renditions in config, using defaults")
+        configured = DEFAULT_RENDITIONS
+    valid = []
+    for rendition in configured:
+        try:
+            name = re.sub(r"[^A-Za-z0-9_-]", "_", str(rendition.get("name", "share"))) or "share"
+            height = int(rendition.get("height", 720))
+            max_bitrate = str(rendition.get("max_bitrate", "4M"))
+            if not 16 <= height <= 4320:
+                raise ValueError(f"height {height} must be 16-4320")
+            if not re.fullmatch(r"\d+(\.\d+)?[kKmM]?", max_bitrate):
+                raise ValueError(f"max_bitrate {max_bitrate!r} must look like 4M or 2500k")
+        except (TypeError, ValueError) as e:
+            print(f"[-] Skipping invalid rendition {rendition}: {e}")
+            continue
+        valid.append({"name": name, "height": height, "max_bitrate": max_bitrate})
+    if not valid:
+        print("[-] No valid renditions in config, using defaults")
+        valid = DEFAULT_RENDITIONS
+    return bool(config.get("renditions_enabled", False)), valid
+
+def load_follow_settings():
+    """Load cursor-follow mode, viewport size, dead zone and easing from the config file."""
+    config = read_config_file()
+    try:
+        size = tuple(int(v) for v in config.get("follow_size", (1280, 720)))
+        if len(size) != 2 or min(size) < 16:
+            raise ValueError(f"bad viewport size {size}")
+        dead_zone = min(max(float(config.get("follow_dead_zone", 0.3)), 0.0), 0.9)
+        easing = min(max(float(config.get("follow_easing", 0.15)), 0.01), 1.0)
+    except (TypeError, ValueError) as e:
+        print(f"[-] Invalid follow settings in config, using defaults: {e}")
+        size, dead_zone, easing = (1280, 720), 0.3, 0.15
+    return bool(config.get("follow_cursor", False)), size, dead_zone, easing
+
+def load_capture_process_setting():
+    """Load whether capture runs in child processes from the config file."""
+    return bool(read_config_file().get("capture_process", False))
+
 def delete_old_recordings():
     """Delete old recordings based on pattern."""
-    patterns = ["screen_record_*.mp4", "*_twitter.mp4"]
+    patterns = ["screen_record_*.mp4", "*_twitter.mp4", "screen_record_*_hls"]
     deleted_count = 0
     for pattern in patterns:
         for file_path in save_path.glob(pattern):
             try:
-                os.remove(file_path)
+                if file_path.is_dir():
+                    shutil.rmtree(file_path)
+                else:
+                    os.remove(file_path)
                 deleted_count += 1
                 print(f"[+] Deleted old recording: {file_path.name}")
             except Exception as e:
@@ -405,96 +850,632 @@ def toggle_cursor():
     messagebox.showinfo("Cursor Visibility", f"Cursor in recordings: {'ON' if show_cursor else 'OFF'}")
     print(f"[+] Cursor visibility: {'ON' if show_cursor else 'OFF'}")
 
-def record_screen(duration, fps=30):
-    """Record the screen for the specified duration."""
-    global is_recording, stop_flag, last_recorded_file
-    if replace_mode:
-        deleted_count = delete_old_recordings()
-        if deleted_count > 0:
-            status_label.config(text=f"Deleted {deleted_count} old recordings...")
-            time.sleep(1)
-    was_visible = root.winfo_viewable()
-    if was_visible:
-        root.withdraw()
-        print("[+] Window hidden during recording")
+def get_capture_area():
+    """Return (x, y, width, height) of the current recording target."""
+    if selected_monitor is not None:
+        monitor = get_monitors()[selected_monitor][1]
+        x, y, width, height = monitor['left'], monitor['top'], monitor['width'], monitor['height']
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid screen dimensions")
+        return x, y, width, height
+    if record_region:
+        return tuple(record_region)
     with mss.mss() as sct:
-        if selected_monitor is not None:
-            try:
-                monitor = get_monitors()[selected_monitor][1]
-                x, y, width, height = monitor['left'], monitor['top'], monitor['width'], monitor['height']
-                print(f"[+] Recording screen {selected_monitor+1}: {width}x{height} at ({x},{y})")
-                if width <= 0 or height <= 0:
-                    raise ValueError("Invalid screen dimensions")
-                mon = {"left": x, "top": y, "width": width, "height": height}
-            except (IndexError, ValueError) as e:
-                print(f"[-] Error with screen selection: {e}")
-                status_label.config(text="Error: Invalid screen selection")
-                if was_visible:
-                    root.deiconify()
-                return
-        elif record_region:
-            x, y, width, height = record_region
-            print(f"[+] Recording region: {width}x{height} at ({x},{y})")
-            mon = {"left": x, "top": y, "width": width, "height": height}
+        screen_size = sct.monitors[0]
+        return 0, 0, min(screen_size["width"], 1920), min(screen_size["height"], 1080)
+
+def open_outputs(stem, fps, size, probe):
+    """Open the main writer and any renditions. Returns (writer, filename, extra_outputs)."""
+    width, height = size
+    backend = tuple(probe["recorder"])
+    if output_mode == "hls":
+        live_preset = live_x264_preset(probe)
+        if live_preset is None:
+            raise RuntimeError("HLS output requires ffmpeg with libx264")
+        stream_dir = save_path / f"{stem}_hls"
+        stream_dir.mkdir(parents=True, exist_ok=True)
+        filename = stream_dir / "index.m3u8"
+        out = open_hls_writer(filename, fps, size, live_preset)
+        kept = "all segments kept" if hls_keep_all else f"{hls_window_segments} segments kept"
+        print(f"[+] Streaming HLS ({hls_segment_seconds}s segments, {kept}, preset {live_preset}): {filename}")
+        print(f"[+] Serve it with: python -m http.server --directory \"{stream_dir}\"")
+    else:
+        filename = save_path / f"{stem}.mp4"
+        out = open_video_writer(filename, fps, size, backend)
+        if not out.isOpened() and backend != DEFAULT_ENCODER:
+            print(f"[-] Encoder {backend[0]}:{backend[1]} failed to open, falling back to {DEFAULT_ENCODER[1]}")
+            out = open_video_writer(filename, fps, size)
+        print(f"[+] Encoding with {backend[0]}:{backend[1]} at {width}x{height}")
+    try:
+        extra_outputs = open_renditions(stem, fps, size, probe) if renditions_enabled else []
+    except Exception:
+        out.release()
+        raise
+    return out, filename, extra_outputs
+
+def overlay_cursor(frame, x, y):
+    """Draw the current mouse position onto a frame captured with its top-left corner at (x, y)."""
+    try:
+        cursor_x, cursor_y = pyautogui.position()
+        draw_cursor(frame, cursor_x - x, cursor_y - y)
+    except Exception as e:
+        print(f"[-] Error drawing cursor: {e}")
+
+def capture_loop(sct, mon, fps, duration, should_stop, on_frame, on_stats, next_region=None):
+    """Grab mon at a steady fps until duration elapses or should_stop() returns True.
+
+    on_frame(img, region) handles each screenshot and returns False if it had to drop it;
+    on_stats(stats) gets elapsed time, live fps and drop count every STATS_INTERVAL;
+    next_region(), if given, supplies a fresh region to grab for every frame.
+    Returns (frames, drops, error), where error is the message that ended capture early, or None.
+    """
+    start_time = time.time()
+    frame_interval = 1.0 / fps
+    next_frame_time = start_time
+    frames_written = dropped_frames = 0
+    stats_time, stats_frames = start_time, 0
+    try:
+        while time.time() - start_time < duration:
+            if should_stop():
+                break
+            current_time = time.time()
+            if current_time >= next_frame_time:
+                region = next_region() if next_region else mon
+                if on_frame(sct.grab(region), region):
+                    frames_written += 1
+                else:
+                    dropped_frames += 1
+                next_frame_time += frame_interval
+                if next_frame_time < current_time:
+                    dropped_frames += int((current_time - next_frame_time) / frame_interval) + 1
+                    next_frame_time = current_time + frame_interval
+                if current_time - stats_time >= STATS_INTERVAL:
+                    on_stats({
+                        "elapsed": current_time - start_time,
+                        "fps": (frames_written - stats_frames) / (current_time - stats_time),
+                        "drops": dropped_frames
+                    })
+                    stats_time, stats_frames = current_time, frames_written
+            time.sleep(max(0, next_frame_time - time.time()))
+    except Exception as e:
+        print(f"[-] Recording error: {e}")
+        return frames_written, dropped_frames, str(e)
+    return frames_written, dropped_frames, None
+
+def record_with_thread(sct, mon, fps, duration, probe, stem, follow=None):
+    """Capture and encode on the calling thread. Returns (filename, extra_paths, frames, drops)."""
+    out, filename, extra_outputs = open_outputs(stem, fps, (mon["width"], mon["height"]), probe)
+    def write_frame(img, region):
+        frame = screenshot_to_bgr(img)
+        if show_cursor:
+            overlay_cursor(frame, region["left"], region["top"])
+        out.write(frame)
+        if extra_outputs:
+            write_renditions(extra_outputs, frame)
+        return True
+    def report_stats(stats):
+        stats["size"] = recording_size(filename)
+        post_ui("stats", stats)
+    try:
+        frames_written, dropped_frames, error = capture_loop(sct, mon, fps, duration, lambda: stop_flag,
+                                                             write_frame, report_stats,
+                                                             make_follow_region(**follow) if follow else None)
+        if error:
+            post_ui("status", f"Recording error: {error}")
+    finally:
+        out.release()
+        for writer, _, _ in extra_outputs:
+            writer.release()
+    return filename, [path for _, _, path in extra_outputs], frames_written, dropped_frames
+
+def pan_viewport(left, top, size, cursor, bounds, dead_zone, easing):
+    """Ease a viewport's top-left corner toward keeping the cursor inside its central dead zone.
+
+    dead_zone is the fraction of the viewport, centred on it, in which cursor movement is ignored;
+    easing is the fraction of the remaining distance covered per frame.
+    """
+    width, height = size
+    new_position = []
+    for origin, extent, point, bound_origin, bound_extent in (
+            (left, width, cursor[0], bounds["left"], bounds["width"]),
+            (top, height, cursor[1], bounds["top"], bounds["height"])):
+        center = origin + extent / 2
+        slack = extent * dead_zone / 2
+        if point > center + slack:
+            target = point - slack
+        elif point < center - slack:
+            target = point + slack
         else:
-            screen_size = sct.monitors[0]
-            x, y = 0, 0
-            width = min(screen_size["width"], 1920)
-            height = min(screen_size["height"], 1080)
-            print(f"[+] Recording primary screen: {width}x{height}")
-            mon = {"left": x, "top": y, "width": width, "height": height}
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        filename = save_path / f"screen_record_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-        out = cv2.VideoWriter(str(filename), fourcc, fps, (width, height))
-        is_recording = True
-        stop_flag = False
-        status_text = f"Recording {'screen ' + str(selected_monitor+1) if selected_monitor is not None else 'region' if record_region else 'primary screen'}..."
-        status_label.config(text=status_text)
-        start_time = time.time()
-        frame_interval = 1.0 / fps
-        next_frame_time = start_time
+            target = center
+        center += (target - center) * easing
+        new_position.append(min(max(center - extent / 2, bound_origin), bound_origin + bound_extent - extent))
+    return new_position[0], new_position[1]
+
+def make_follow_region(bounds, size, dead_zone, easing):
+    """Return next_region() for a viewport of size that pans after the cursor within bounds."""
+    width = max(2, min(size[0], bounds["width"]) // 2 * 2)
+    height = max(2, min(size[1], bounds["height"]) // 2 * 2)
+    try:
+        cursor = pyautogui.position()
+        start = pan_viewport(cursor[0] - width / 2, cursor[1] - height / 2, (width, height), cursor, bounds, 0, 1)
+    except Exception as e:
+        print(f"[-] Error reading cursor, starting viewport centred: {e}")
+        start = (bounds["left"] + (bounds["width"] - width) / 2, bounds["top"] + (bounds["height"] - height) / 2)
+    position = list(start)
+    def next_region():
+        try:
+            position[:] = pan_viewport(position[0], position[1], (width, height), pyautogui.position(),
+                                       bounds, dead_zone, easing)
+        except Exception as e:
+            print(f"[-] Error following cursor: {e}")
+        return {"left": round(position[0]), "top": round(position[1]), "width": width, "height": height}
+    return next_region
+
+def follow_setup(mon):
+    """Return (follow spec or None, initial capture area) for mon under the current follow setting."""
+    if not follow_cursor:
+        return None, mon
+    follow = {"bounds": mon, "size": list(follow_size), "dead_zone": follow_dead_zone, "easing": follow_easing}
+    viewport = make_follow_region(**follow)()
+    print(f"[+] Following cursor with a {viewport['width']}x{viewport['height']} viewport")
+    return follow, viewport
+
+def attach_ring(spec, ring_name):
+    """Map the shared-memory frame ring described by spec. Returns (shm, ring array)."""
+    ring_shm = shared_memory.SharedMemory(name=ring_name)
+    shape = (spec["slots"], spec["mon"]["height"], spec["mon"]["width"], 3)
+    return ring_shm, np.ndarray(shape, dtype=np.uint8, buffer=ring_shm.buf)
+
+def capture_worker(spec, ring_name, filled_queue, free_queue, stop_event, status_queue):
+    """Child process: grab frames straight into free ring slots and hand their indices to the encoder."""
+    ring_shm, ring = attach_ring(spec, ring_name)
+    def fill_slot(img, region):
+        try:
+            slot = free_queue.get_nowait()
+        except queue.Empty:
+            return False  # Encoder is behind and every slot is in use
+        screenshot_to_bgr(img, dst=ring[slot])
+        if spec["show_cursor"]:
+            overlay_cursor(ring[slot], region["left"], region["top"])
+        filled_queue.put(slot)
+        return True
+    try:
+        with mss.mss() as sct:
+            frames_written, dropped_frames, error = capture_loop(
+                sct, spec["mon"], spec["fps"], spec["duration"], stop_event.is_set, fill_slot,
+                lambda stats: status_queue.put(("stats", stats)),
+                make_follow_region(**spec["follow"]) if spec["follow"] else None)
+        if error:
+            status_queue.put(("error", error))
+        status_queue.put(("done", frames_written, dropped_frames))
+    finally:
+        del ring
+        ring_shm.close()
+
+def encode_worker(spec, ring_name, filled_queue, free_queue, status_queue):
+    """Child process: open the outputs and encode ring slots in order until a None sentinel arrives."""
+    global save_path, output_mode, hls_segment_seconds, hls_window_segments, hls_keep_all, renditions_enabled, renditions
+    save_path = Path(spec["save_path"])
+    output_mode = spec["output_mode"]
+    hls_segment_seconds, hls_window_segments = spec["hls_segment_seconds"], spec["hls_window_segments"]
+    hls_keep_all = spec["hls_keep_all"]
+    renditions_enabled, renditions = spec["renditions_enabled"], spec["renditions"]
+    ring_shm, ring = attach_ring(spec, ring_name)
+    try:
+        try:
+            out, filename, extra_outputs = open_outputs(spec["stem"], spec["fps"],
+                                                        (spec["mon"]["width"], spec["mon"]["height"]), spec["probe"])
+        except Exception as e:
+            status_queue.put(("error", str(e)))
+            return
+        status_queue.put(("opened", str(filename), [str(path) for _, _, path in extra_outputs]))
         try:
-            while time.time() - start_time < duration:
-                if stop_flag:
+            while True:
+                slot = filled_queue.get()
+                if slot is None:
                     break
-                current_time = time.time()
-                if current_time >= next_frame_time:
-                    img = sct.grab(mon)
-                    frame = np.array(img)
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-                    if show_cursor:
-                        try:
-                            cursor_x, cursor_y = pyautogui.position()
-                            rel_x = cursor_x - x
-                            rel_y = cursor_y - y
-                            if 0 <= rel_x < width and 0 <= rel_y < height:
-                                cv2.circle(frame, (rel_x, rel_y), 5, (0, 0, 0), 1)
-                                cv2.circle(frame, (rel_x, rel_y), 3, (255, 255, 255), -1)
-                        except Exception as e:
-                            print(f"[-] Error drawing cursor: {e}")
-                    out.write(frame)
-                    next_frame_time += frame_interval
-                    if next_frame_time < current_time:
-                        next_frame_time = current_time + frame_interval
-                time.sleep(max(0, next_frame_time - time.time()))
+                out.write(ring[slot])
+                if extra_outputs:
+                    write_renditions(extra_outputs, ring[slot])
+                free_queue.put(slot)
         except Exception as e:
-            print(f"[-] Recording error: {e}")
-            status_label.config(text=f"Recording error: {e}")
+            print(f"[-] Encoder error: {e}")
+            status_queue.put(("encoder_error", str(e)))
         finally:
             out.release()
-            is_recording = False
+            for writer, _, _ in extra_outputs:
+                writer.release()
+    finally:
+        del ring
+        ring_shm.close()
+
+def record_with_processes(mon, fps, duration, probe, stem, follow=None):
+    """Capture and encode in child processes sharing a frame ring. Returns (filename, extra_paths, frames, drops)."""
+    frame_bytes = mon["width"] * mon["height"] * 3
+    slots = max(2, min(RING_MAX_SLOTS, RING_BYTES_BUDGET // frame_bytes))
+    ctx = multiprocessing.get_context("spawn")  # Never fork the Tk process; matches Windows everywhere
+    ring_shm = shared_memory.SharedMemory(create=True, size=slots * frame_bytes)
+    filled_queue, free_queue, status_queue = ctx.Queue(), ctx.Queue(), ctx.Queue()
+    stop_event = ctx.Event()
+    for slot in range(slots):
+        free_queue.put(slot)
+    spec = {
+        "mon": dict(mon), "follow": follow, "fps": fps, "duration": duration, "slots": slots, "stem": stem,
+        "probe": probe, "show_cursor": show_cursor, "save_path": str(save_path), "output_mode": output_mode,
+        "hls_segment_seconds": hls_segment_seconds, "hls_window_segments": hls_window_segments,
+        "hls_keep_all": hls_keep_all, "renditions_enabled": renditions_enabled, "renditions": renditions
+    }
+    ring_name = ring_shm.name
+    encoder = ctx.Process(target=encode_worker, args=(spec, ring_name, filled_queue, free_queue, status_queue), daemon=True)
+    capturer = ctx.Process(target=capture_worker, args=(spec, ring_name, filled_queue, free_queue, stop_event, status_queue), daemon=True)
+    print(f"[+] Capturing in child processes with a {slots}-slot shared-memory ring")
+    frames_written = dropped_frames = 0
+    encoder_error = None
+    try:
+        encoder.start()
+        try:
+            message = status_queue.get(timeout=PROCESS_START_TIMEOUT)
+        except queue.Empty:
+            raise RuntimeError("encoder process did not start") from None
+        if message[0] == "error":
+            raise RuntimeError(message[1])
+        filename, extra_paths = Path(message[1]), [Path(path) for path in message[2]]
+        capturer.start()
+        while True:
+            if stop_flag:
+                stop_event.set()
+            if encoder_error is None and not encoder.is_alive():
+                encoder_error = f"encoder process exited with code {encoder.exitcode}"
+                print(f"[-] {encoder_error}")
+                post_ui("status", f"Recording error: {encoder_error}")
+                stop_event.set()
+            try:
+                message = status_queue.get(timeout=0.1)
+            except queue.Empty:
+                if not capturer.is_alive():
+                    print("[-] Capture process exited unexpectedly")
+                    break
+                continue
+            if message[0] == "stats":
+                message[1]["size"] = recording_size(filename)
+                post_ui("stats", message[1])
+            elif message[0] == "error":
+                post_ui("status", f"Recording error: {message[1]}")
+            elif message[0] == "encoder_error":
+                # No slot will ever be freed again, so stop capturing instead of dropping every frame
+                encoder_error = message[1]
+                post_ui("status", f"Recording error: {encoder_error}")
+                stop_event.set()
+            elif message[0] == "done":
+                frames_written, dropped_frames = message[1], message[2]
+                break
+        capturer.join()
+        filled_queue.put(None)
+        encoder.join()
+    finally:
+        stop_event.set()
+        for proc in (capturer, encoder):
+            if proc.is_alive():
+                proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        ring_shm.close()
+        ring_shm.unlink()
+    if encoder_error is not None:
+        raise RuntimeError(f"Encoder failed: {encoder_error}")
+    return filename, extra_paths, frames_written, dropped_frames
+
+def recording_size(path):
+    """Return bytes written so far for an MP4 file or an HLS playlist directory."""
+    try:
+        if path.suffix == ".m3u8":
+            return sum(entry.stat().st_size for entry in os.scandir(path.parent) if entry.is_file())
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+def record_screen(duration, fps=30, was_visible=False):
+    """Record the screen for the specified duration."""
+    global is_recording, stop_flag, last_recorded_file
+    is_recording = True  # Already set by start_recording; covers direct callers too
+    capture_done = False
+    window_hidden = False
+    def finish_capture():
+        # Runs once, as soon as capture ends or anything fails, so post-processing never blocks a new recording
+        global is_recording
+        nonlocal capture_done
+        if capture_done:
+            return
+        capture_done = True
+        is_recording = False
+        post_ui("hud_hide")
+        if window_hidden:
+            post_ui("restore_window")
+            print("[+] Window restored after recording")
+    try:
+        if replace_mode:
+            deleted_count = delete_old_recordings()
+            if deleted_count > 0:
+                post_ui("status", f"Deleted {deleted_count} old recordings...")
+                time.sleep(1)
+        with mss.mss() as sct:
+            if selected_monitor is not None:
+                try:
+                    monitor = get_monitors()[selected_monitor][1]
+                    x, y, width, height = monitor['left'], monitor['top'], monitor['width'], monitor['height']
+                    print(f"[+] Recording screen {selected_monitor+1}: {width}x{height} at ({x},{y})")
+                    if width <= 0 or height <= 0:
+                        raise ValueError("Invalid screen dimensions")
+                    mon = {"left": x, "top": y, "width": width, "height": height}
+                except (IndexError, ValueError) as e:
+                    print(f"[-] Error with screen selection: {e}")
+                    post_ui("status", "Error: Invalid screen selection")
+                    return
+            elif record_region:
+                x, y, width, height = record_region
+                print(f"[+] Recording region: {width}x{height} at ({x},{y})")
+                mon = {"left": x, "top": y, "width": width, "height": height}
+            else:
+                screen_size = sct.monitors[0]
+                x, y = 0, 0
+                width = min(screen_size["width"], 1920)
+                height = min(screen_size["height"], 1080)
+                print(f"[+] Recording primary screen: {width}x{height}")
+                mon = {"left": x, "top": y, "width": width, "height": height}
+            follow, mon = follow_setup(mon)
+            width, height = mon["width"], mon["height"]
+            # Probe while the window is still visible so the status shows; Stop interrupts it
+            if probe_key(width, height, fps) not in encoder_probe:
+                post_ui("status", "Probing encoders (first run for this size, Stop cancels)...")
+            try:
+                probe = select_encoder(width, height, fps, should_stop=lambda: stop_flag)
+            except Exception as e:
+                print(f"[-] Encoder probe error: {e}")
+                post_ui("status", f"Encoder probe error: {e}")
+                return
+            if probe is None or stop_flag:
+                print("[+] Recording cancelled during encoder probe")
+                post_ui("status", "Recording cancelled")
+                return
             if was_visible:
-                root.deiconify()
-                root.state('normal')
-                root.lift()
-                print("[+] Window restored after recording")
-        status_label.config(text="Encoding for Twitter...")
-        twitter_file = convert_to_twitter_format(filename)
-        last_recorded_file = twitter_file
+                window_hidden = True
+                hide_window_and_wait()
+                print("[+] Window hidden during recording")
+            stem = f"screen_record_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            status_text = f"Recording {'screen ' + str(selected_monitor+1) if selected_monitor is not None else 'region' if record_region else 'primary screen'}..."
+            post_ui("status", status_text)
+            post_ui("hud_show")
+            try:
+                if capture_process:
+                    filename, extra_paths, frames_written, dropped_frames = record_with_processes(mon, fps, duration, probe, stem, follow)
+                else:
+                    filename, extra_paths, frames_written, dropped_frames = record_with_thread(sct, mon, fps, duration, probe, stem, follow)
+            finally:
+                finish_capture()
+        print(f"[+] Captured {frames_written} frames, dropped {dropped_frames}")
         mode_text = " (Replace Mode)" if replace_mode else ""
         region_text = f" (Screen {selected_monitor+1})" if selected_monitor is not None else " (Region)" if record_region else " (Primary Screen)"
-        status_label.config(text=f"Saved Twitter-ready{mode_text}{region_text}:\n{twitter_file}")
+        if extra_paths:
+            # The renditions were encoded live, so they are already final
+            last_recorded_file = extra_paths[0]
+            names = ", ".join(path.name for path in extra_paths)
+            post_ui("status", f"Saved{mode_text}{region_text}:\n{filename.name} + {names}")
+            print(f"[+] Saved {filename} with renditions: {names}")
+            return
+        if output_mode == "hls":
+            last_recorded_file = filename.parent
+            if hls_keep_all:
+                post_ui("status", f"HLS stream ended{mode_text}{region_text}; all segments kept in:\n{filename.parent}")
+                print(f"[+] HLS stream ended, all segments kept in: {filename.parent}")
+                return
+            # delete_segments keeps only the live window, so what is left is the tail of the session
+            tail_seconds = hls_segment_seconds * hls_window_segments
+            post_ui("status", f"HLS live window ended{mode_text}{region_text}; last ~{tail_seconds}s kept in:\n{filename.parent}")
+            print(f"[+] HLS stream ended, last ~{tail_seconds}s kept in: {filename.parent}")
+            return
+        post_ui("status", "Encoding for Twitter...")
+        twitter_file = convert_to_twitter_format(filename)
+        last_recorded_file = twitter_file
+        post_ui("status", f"Saved Twitter-ready{mode_text}{region_text}:\n{twitter_file}")
         print(f"[+] Saved Twitter-ready: {twitter_file}")
+    except Exception as e:
+        print(f"[-] Recording error: {e}")
+        post_ui("status", f"Recording error: {e}")
+    finally:
+        finish_capture()
+
+def load_job_file(path):
+    """Read and validate a job file. Returns a list of jobs with defaults filled in.
+
+    The file holds {"jobs": [...]} (or a bare list); each job has a source ("primary", "monitor:N"
+    or "region:x,y,w,h"), duration in seconds, and optional fps, preset, output, start_at ("HH:MM"),
+    every (seconds between runs) and repeat (number of runs; unlimited when every is set).
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    entries = data.get("jobs", []) if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Job file has no jobs")
+    jobs = []
+    for number, entry in enumerate(entries, 1):
+        try:
+            duration = float(entry["duration"])
+            fps = int(entry.get("fps", 30))
+            if duration <= 0 or fps <= 0:
+                raise ValueError("duration and fps must be positive")
+            preset = entry.get("preset", "auto")
+            if preset not in X264_PRESETS and preset != "auto":
+                raise ValueError(f"preset must be 'auto' or one of {', '.join(X264_PRESETS)}")
+            start_at = None
+            if entry.get("start_at"):
+                start_at = datetime.strptime(entry["start_at"], "%H:%M")
+            every = float(entry["every"]) if entry.get("every") else None
+            if every is not None and every < duration:
+                raise ValueError("every must be at least the duration")
+            repeat = int(entry["repeat"]) if entry.get("repeat") else (None if every else 1)
+            jobs.append({
+                "source": str(entry.get("source", "primary")),
+                "duration": duration,
+                "fps": fps,
+                "preset": None if preset == "auto" else preset,
+                "output": str(entry.get("output", f"job_{number}")),
+                "start_at": start_at,
+                "every": every,
+                "repeat": repeat
+            })
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Job {number}: {e}")
+    return jobs
+
+def parse_job_source(source, sct):
+    """Turn a job source such as "monitor:2" or "region:0,0,800,600" into an mss capture area."""
+    if source == "primary":
+        screen_size = sct.monitors[0]
+        return {"left": 0, "top": 0, "width": min(screen_size["width"], 1920), "height": min(screen_size["height"], 1080)}
+    kind, _, value = source.partition(":")
+    if kind == "monitor":
+        index = int(value)
+        if not 1 <= index < len(sct.monitors):
+            raise ValueError(f"Screen {index} not found")
+        return dict(sct.monitors[index])
+    if kind == "region":
+        x, y, width, height = (int(v) for v in value.split(","))
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid region dimensions")
+        return {"left": x, "top": y, "width": width, "height": height}
+    raise ValueError(f"Unknown job source '{source}'")
+
+def finalize_outputs(filename, extra_paths):
+    """Return the shareable file for a finished capture, re-encoding for Twitter only when nothing live is final."""
+    if extra_paths:
+        return extra_paths[0]
+    if filename.suffix == ".m3u8":
+        return filename.parent
+    return convert_to_twitter_format(filename)
+
+def run_job(sct, job):
+    """Capture one job with the current follow settings. Returns (filename, extra_paths).
+
+    Jobs always capture on this thread through the shared mss session. Process capture would spawn
+    fresh children and a fresh ring per job, so run_jobs does not use it.
+    """
+    global is_recording
+    follow, mon = follow_setup(parse_job_source(job["source"], sct))
+    probe = select_encoder(mon["width"], mon["height"], job["fps"], should_stop=lambda: stop_flag)
+    if probe is None:
+        raise RuntimeError("encoder probe cancelled")
+    if job["preset"]:
+        if live_x264_preset(probe) is None:
+            print(f"[-] Job {job['output']}: libx264 unavailable, ignoring preset {job['preset']}")
+        else:
+            probe = dict(probe, recorder=["ffmpeg", job["preset"]])
+    output = re.sub(r"[^A-Za-z0-9_-]", "_", job["output"]) or "job"
+    stem = f"screen_record_job_{output}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    print(f"[+] Job {job['output']}: {mon['width']}x{mon['height']} at ({mon['left']},{mon['top']}) for {job['duration']}s")
+    is_recording = True
+    post_ui("hud_show")
+    try:
+        filename, extra_paths, frames_written, dropped_frames = record_with_thread(
+            sct, mon, job["fps"], job["duration"], probe, stem, follow)
+    finally:
+        is_recording = False
+        post_ui("hud_hide")
+    print(f"[+] Job {job['output']}: captured {frames_written} frames, dropped {dropped_frames}")
+    return filename, extra_paths
+
+def run_jobs(jobs, was_visible=False):
+    """Run jobs back to back or on their timetable until done or stopped.
+
+    One mss session stays open for every job, and each job's post-processing runs on a
+    background worker while the next job captures; each job is reported as soon as it is final.
+    """
+    global jobs_running, stop_flag
+    jobs_running = True
+    stop_flag = False
+    if capture_process:
+        print("[-] Capture: Process is not used for job runs; jobs capture on a thread")
+    if was_visible:
+        hide_window_and_wait()
+    now = datetime.now()
+    schedule = []
+    for index, job in enumerate(jobs):
+        due = now
+        if job["start_at"]:
+            due = now.replace(hour=job["start_at"].hour, minute=job["start_at"].minute, second=0, microsecond=0)
+            if due < now:
+                due += timedelta(days=1)
+        schedule.append([due.timestamp(), index, job["repeat"]])
+    saved = []
+    runs = 0
+    def report_job(name, future):
+        global last_recorded_file
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"[-] Job {name} post-processing failed: {e}")
+            post_ui("status", f"Job {name} post-processing failed: {e}")
+            return
+        last_recorded_file = result
+        saved.append(name)
+        print(f"[+] Job {name} saved: {result}")
+        post_ui("status", f"Job {name} saved:\n{result}")
+    try:
+        with mss.mss() as sct, ThreadPoolExecutor(max_workers=1) as post_processor:
+            while schedule and not stop_flag:
+                schedule.sort(key=lambda entry: (entry[0], entry[1]))
+                due, index, runs_left = schedule[0]
+                job = jobs[index]
+                if time.time() < due:
+                    post_ui("status", f"Next job '{job['output']}' at {datetime.fromtimestamp(due).strftime('%H:%M:%S')}")
+                    time.sleep(max(0, min(0.5, due - time.time())))
+                    continue
+                runs += 1
+                post_ui("status", f"Job {runs} ({job['output']}): recording...")
+                try:
+                    filename, extra_paths = run_job(sct, job)
+                    future = post_processor.submit(finalize_outputs, filename, extra_paths)
+                    future.add_done_callback(lambda done, name=job["output"]: report_job(name, done))
+                except Exception as e:
+                    print(f"[-] Job {job['output']} failed: {e}")
+                    post_ui("status", f"Job {job['output']} failed: {e}")
+                if runs_left is not None:
+                    runs_left -= 1
+                if runs_left == 0:
+                    schedule.pop(0)
+                    continue
+                next_due = due + job["every"] if job["every"] else time.time()
+                while next_due <= time.time() and job["every"]:
+                    next_due += job["every"]  # Skip slots missed while an earlier job overran
+                schedule[0] = [next_due, index, runs_left]
+            post_ui("status", "Finishing job post-processing...")
+        stopped_text = " (stopped)" if stop_flag else ""
+        post_ui("status", f"Jobs finished{stopped_text}: {len(saved)}/{runs} saved")
+        print(f"[+] Jobs finished{stopped_text}: {len(saved)}/{runs} saved")
+    finally:
+        jobs_running = False
+        stop_flag = False
+        if was_visible:
+            post_ui("restore_window")
+
+def start_job_file(path=None):
+    """Load a job file (asking for one if not given) and run it on a worker thread."""
+    if is_recording or jobs_running:
+        messagebox.showwarning("Busy", "A recording or job run is already in progress.")
+        return
+    if path is None:
+        path = filedialog.askopenfilename(title="Select Job File", filetypes=[("Job files", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+    try:
+        jobs = load_job_file(path)
+    except Exception as e:
+        messagebox.showerror("Invalid Job File", f"Could not load {path}:\n{e}")
+        print(f"[-] Invalid job file {path}: {e}")
+        return
+    print(f"[+] Loaded {len(jobs)} job(s) from {path}")
+    thread_note = "\nCapture: Process is ignored, jobs capture on a thread" if capture_process else ""
+    status_label.config(text=f"Running {len(jobs)} job(s) from {Path(path).name}... (Stop Recording cancels){thread_note}")
+    threading.Thread(target=run_jobs, args=(jobs,), kwargs={"was_visible": bool(root.winfo_viewable())}, daemon=True).start()
 
 def toggle_replace_mode():
     """Toggle replace mode for recordings."""
@@ -507,9 +1488,73 @@ def toggle_replace_mode():
     messagebox.showinfo("Mode Changed", f"{'Replace' if replace_mode else 'Accumulate'} Mode: {'New recordings will delete old ones' if replace_mode else 'Keep all recordings'}")
     print(f"[+] Replace mode: {'ON' if replace_mode else 'OFF'}")
 
+def toggle_output_mode():
+    """Toggle between single-file MP4 output and live HLS segments."""
+    global output_mode
+    if is_recording:
+        messagebox.showwarning("Recording in Progress", "Cannot change output mode while recording.")
+        return
+    output_mode = "file" if output_mode == "hls" else "hls"
+    output_toggle_btn.config(text=f"📡 Output: {'HLS Live' if output_mode == 'hls' else 'MP4 File'}",
+                             bg="green" if output_mode == "hls" else "lightgray")
+    update_config(output_mode=output_mode)
+    if output_mode == "hls" and hls_keep_all:
+        info = "HLS Live: segments + index.m3u8 playable while recording; every segment is kept"
+    elif output_mode == "hls":
+        info = (f"HLS Live: rolling segments + index.m3u8 playable while recording.\n"
+                f"Only the last ~{hls_segment_seconds * hls_window_segments}s are kept; older segments are deleted.\n"
+                f"Turn on 'Keep all HLS segments' in Settings to keep the whole session.")
+    else:
+        info = "MP4 File: single file, Twitter-ready after recording"
+    messagebox.showinfo("Output Mode", info)
+    print(f"[+] Output mode: {output_mode}")
+
+def toggle_renditions():
+    """Toggle recording the extra share renditions alongside the main output."""
+    global renditions_enabled
+    if is_recording:
+        messagebox.showwarning("Recording in Progress", "Cannot change renditions while recording.")
+        return
+    renditions_enabled = not renditions_enabled
+    renditions_toggle_btn.config(text=f"🎞️ Share Copies: {'ON' if renditions_enabled else 'OFF'}",
+                                 bg="green" if renditions_enabled else "lightgray")
+    update_config(renditions_enabled=renditions_enabled)
+    summary = ", ".join(f"{r.get('name', 'share')} {r.get('height', 720)}p" for r in renditions)
+    messagebox.showinfo("Share Copies", f"Also recording: {summary}" if renditions_enabled else "Recording main output only")
+    print(f"[+] Renditions: {'ON' if renditions_enabled else 'OFF'}")
+
+def toggle_capture_process():
+    """Toggle running capture and encode in child processes instead of a thread."""
+    global capture_process
+    if is_recording:
+        messagebox.showwarning("Recording in Progress", "Cannot change capture mode while recording.")
+        return
+    capture_process = not capture_process
+    capture_toggle_btn.config(text=f"⚙️ Capture: {'Process' if capture_process else 'Thread'}",
+                              bg="green" if capture_process else "lightgray")
+    update_config(capture_process=capture_process)
+    messagebox.showinfo("Capture Mode", "Process: capture and encode run outside the GUI process"
+                        if capture_process else "Thread: capture and encode run on a worker thread")
+    print(f"[+] Capture mode: {'process' if capture_process else 'thread'}")
+
+def toggle_follow_cursor():
+    """Toggle recording a cursor-following viewport instead of the whole region."""
+    global follow_cursor
+    if is_recording:
+        messagebox.showwarning("Recording in Progress", "Cannot change follow mode while recording.")
+        return
+    follow_cursor = not follow_cursor
+    follow_toggle_btn.config(text=f"🔍 Follow Cursor: {'ON' if follow_cursor else 'OFF'}",
+                             bg="green" if follow_cursor else "lightgray")
+    update_config(follow_cursor=follow_cursor)
+    messagebox.showinfo("Follow Cursor", f"Recording a {follow_size[0]}x{follow_size[1]} viewport that follows the cursor"
+                        if follow_cursor else "Recording the whole region")
+    print(f"[+] Follow cursor: {'ON' if follow_cursor else 'OFF'}")
+
 def start_recording():
     """Start the screen recording."""
-    if is_recording:
+    global is_recording, stop_flag
+    if is_recording or jobs_running:
         return
     duration_value = duration_entry.get()
     unit = duration_unit.get()
@@ -517,7 +1562,10 @@ def start_recording():
     if duration_sec <= 0:
         messagebox.showerror("Invalid Duration", "Please enter a valid number for duration.")
         return
-    t = threading.Thread(target=record_screen, args=(duration_sec,))
+    # Mark busy before the thread starts so a second press during the encoder probe is ignored
+    is_recording = True
+    stop_flag = False
+    t = threading.Thread(target=record_screen, args=(duration_sec,), kwargs={"was_visible": bool(root.winfo_viewable())})
     t.start()
 
 def convert_to_seconds(value, unit):
@@ -537,7 +1585,7 @@ def convert_to_seconds(value, unit):
 def stop_recording():
     """Stop the current recording."""
     global stop_flag
-    if is_recording:
+    if is_recording or jobs_running:
         stop_flag = True
 
 def toggle_recording():
@@ -548,7 +1596,7 @@ def toggle_recording():
         root.lift()
         root.focus_force()
         return
-    if is_recording:
+    if is_recording or jobs_running:
         stop_recording()
     else:
         start_recording()
@@ -583,9 +1631,29 @@ def browse_folder():
 def open_settings():
     """Open settings window to change hotkeys."""
     def save_hotkey():
-        global hotkey, window_toggle_key
+        global hotkey, window_toggle_key, hls_segment_seconds, hls_window_segments, hls_keep_all
+        global follow_size, follow_dead_zone, follow_easing
         new_hotkey = hotkey_entry.get().strip()
         new_toggle_key = toggle_key_entry.get().strip()
+        try:
+            new_segment_seconds = int(segment_entry.get())
+            new_window_segments = int(window_entry.get())
+            if new_segment_seconds < 1 or new_window_segments < 1:
+                raise ValueError("values must be at least 1")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid HLS settings: {e}")
+            return
+        try:
+            new_follow_size = tuple(int(v) for v in follow_size_entry.get().lower().split("x"))
+            new_dead_zone = float(dead_zone_entry.get())
+            new_easing = float(easing_entry.get())
+            if len(new_follow_size) != 2 or min(new_follow_size) < 16:
+                raise ValueError("viewport must look like 1280x720")
+            if not 0 <= new_dead_zone <= 0.9 or not 0.01 <= new_easing <= 1:
+                raise ValueError("dead zone must be 0-0.9 and easing 0.01-1")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid follow settings: {e}")
+            return
         if new_hotkey:
             try:
                 keyboard.remove_hotkey(hotkey)
@@ -602,11 +1670,18 @@ def open_settings():
             except Exception as e:
                 messagebox.showerror("Error", f"Invalid toggle key: {e}")
                 return
+        hls_segment_seconds, hls_window_segments = new_segment_seconds, new_window_segments
+        hls_keep_all = keep_all_var.get()
+        follow_size, follow_dead_zone, follow_easing = new_follow_size, new_dead_zone, new_easing
+        update_config(hls_segment_seconds=hls_segment_seconds, hls_window_segments=hls_window_segments,
+                      hls_keep_all=hls_keep_all, follow_size=list(follow_size), follow_dead_zone=follow_dead_zone, follow_easing=follow_easing)
         settings_win.destroy()
-        messagebox.showinfo("Hotkeys Set", f"Recording: {hotkey}\nWindow Toggle: {window_toggle_key}")
+        messagebox.showinfo("Settings Saved", f"Recording: {hotkey}\nWindow Toggle: {window_toggle_key}\n"
+                            f"HLS: {hls_segment_seconds}s segments, "
+                            f"{'all kept' if hls_keep_all else f'{hls_window_segments} in playlist'}")
     settings_win = tk.Toplevel(root)
     settings_win.title("Settings")
-    settings_win.geometry("350x180")
+    settings_win.geometry("350x450")
     settings_win.resizable(False, False)
     tk.Label(settings_win, text="Recording Hotkey (e.g. ctrl+shift+r):").pack(pady=(10, 2))
     hotkey_entry = tk.Entry(settings_win, width=25)
@@ -616,6 +1691,29 @@ def open_settings():
     toggle_key_entry = tk.Entry(settings_win, width=25)
     toggle_key_entry.pack(pady=2)
     toggle_key_entry.insert(0, window_toggle_key)
+    tk.Label(settings_win, text="HLS Segment Length (seconds):").pack(pady=(10, 2))
+    segment_entry = tk.Entry(settings_win, width=25)
+    segment_entry.pack(pady=2)
+    segment_entry.insert(0, str(hls_segment_seconds))
+    tk.Label(settings_win, text="HLS Playlist Window (segments):").pack(pady=(10, 2))
+    window_entry = tk.Entry(settings_win, width=25)
+    window_entry.pack(pady=2)
+    window_entry.insert(0, str(hls_window_segments))
+    keep_all_var = tk.BooleanVar(value=hls_keep_all)
+    tk.Checkbutton(settings_win, text="Keep all HLS segments (ignore the window)", variable=keep_all_var).pack(pady=2)
+    tk.Label(settings_win, text="Follow Viewport (e.g. 1280x720):").pack(pady=(10, 2))
+    follow_size_entry = tk.Entry(settings_win, width=25)
+    follow_size_entry.pack(pady=2)
+    follow_size_entry.insert(0, f"{follow_size[0]}x{follow_size[1]}")
+    tk.Label(settings_win, text="Follow Dead Zone (0-0.9) / Easing (0.01-1):").pack(pady=(10, 2))
+    follow_frame = tk.Frame(settings_win)
+    follow_frame.pack(pady=2)
+    dead_zone_entry = tk.Entry(follow_frame, width=11)
+    dead_zone_entry.pack(side='left', padx=2)
+    dead_zone_entry.insert(0, str(follow_dead_zone))
+    easing_entry = tk.Entry(follow_frame, width=11)
+    easing_entry.pack(side='left', padx=2)
+    easing_entry.insert(0, str(follow_easing))
     tk.Button(settings_win, text="Save", command=save_hotkey).pack(pady=15)
 
 def open_last_recorded():
@@ -630,11 +1728,14 @@ def open_save_folder():
     os.startfile(save_path)
 
 def delete_last_recorded():
-    """Delete the last recorded file."""
+    """Delete the last recorded file (or HLS stream directory)."""
     global last_recorded_file
     if last_recorded_file and last_recorded_file.exists():
         try:
-            os.remove(last_recorded_file)
+            if last_recorded_file.is_dir():
+                shutil.rmtree(last_recorded_file)
+            else:
+                os.remove(last_recorded_file)
             messagebox.showinfo("Deleted", f"Deleted: {last_recorded_file.name}")
             last_recorded_file = None
             status_label.config(text="Last recording deleted.")
@@ -720,110 +1821,166 @@ def setup_tray():
     tray_thread.start()
     return icon
 
-# GUI Setup
-root = tk.Tk()
-root.title("Simple Screen Recorder")
-root.geometry("380x650")
-root.resizable(False, False)
-
-# Load configuration
-saved_path, saved_replace_mode, saved_record_region, saved_selected_monitor, saved_show_cursor = load_config()
-save_path = saved_path
-save_path.mkdir(parents=True, exist_ok=True)
-replace_mode = saved_replace_mode
-record_region = saved_record_region
-selected_monitor = saved_selected_monitor
-show_cursor = saved_show_cursor
-
-# GUI Elements
-info_frame = tk.Frame(root, bg='lightgray', relief='sunken', bd=1)
-info_frame.pack(fill='x', pady=(5, 10))
-tk.Label(info_frame, text=f"Hotkeys: {hotkey.upper()} = Record | {window_toggle_key.upper()} = Hide/Show",
-         bg='lightgray', font=('Arial', 8)).pack(pady=3)
-tk.Label(root, text="Duration:").pack(pady=(10, 2))
-duration_entry = tk.Entry(root, width=10)
-duration_entry.pack()
-duration_entry.insert(0, "10")
-duration_unit = tk.StringVar(value="Seconds")
-tk.OptionMenu(root, duration_unit, "Seconds", "Minutes", "Hours").pack(pady=5)
-region_frame = tk.Frame(root, bg='lightyellow', relief='ridge', bd=2)
-region_frame.pack(fill='x', padx=10, pady=5)
-tk.Label(region_frame, text="📹 Recording Region", bg='lightyellow',
-         font=('Arial', 10, 'bold')).pack(pady=(5, 2))
-region_label = tk.Label(region_frame, text="Region: Full Screen (auto)",
-                       bg='lightyellow', font=('Arial', 9), wraplength=320)
-region_label.pack(pady=2)
-region_btn_frame = tk.Frame(region_frame, bg='lightyellow')
-region_btn_frame.pack(pady=(2, 5))
-tk.Button(region_btn_frame, text="🎯 Select Region", command=select_region,
-          bg="lightgreen", font=('Arial', 8)).pack(side='left', padx=2)
-tk.Button(region_btn_frame, text="❌ Clear Region", command=clear_region,
-          bg="lightcoral", font=('Arial', 8)).pack(side='left', padx=2)
-tk.Button(region_btn_frame, text="🖥️ Select Screen", command=select_monitor_dialog,
-          bg="lightblue", font=('Arial', 8)).pack(side='left', padx=2)
-region_btn_frame = tk.Frame(region_frame, bg='lightyellow')
-region_btn_frame.pack(pady=(2, 5))
-tk.Button(region_btn_frame, text="Start Recording", command=start_recording,
-          bg="lightgreen", font=('Arial', 8)).pack(side='left', padx=5)
-tk.Button(region_btn_frame, text="Stop Recording", command=stop_recording,
-          bg="lightcoral", font=('Arial', 8)).pack(side='right', padx=5)
-cursor_toggle_btn = tk.Button(root, text=f"🖱️ Cursor: {'ON' if show_cursor else 'OFF'}",
-                             command=toggle_cursor,
-                             bg="green" if show_cursor else "red",
-                             fg="white" if show_cursor else "black",
-                             font=('Arial', 9, 'bold'))
-cursor_toggle_btn.pack(pady=5)
-tk.Button(root, text="👁️ Toggle Preview", command=start_preview,
-         bg="lightblue", font=('Arial', 9, 'bold')).pack(pady=5)
-replace_toggle_btn = tk.Button(root, text=f"📁 Replace Mode: {'ON' if replace_mode else 'OFF'}",
-                              command=toggle_replace_mode,
-                              bg="green" if replace_mode else "red",
-                              fg="white" if replace_mode else "black",
-                              font=('Arial', 9, 'bold'))
-replace_toggle_btn.pack(pady=5)
-tk.Button(root, text="Choose Save Folder", command=browse_folder).pack(pady=5)
-directory_label = tk.Label(root, text=f"Save to:\n{save_path}", wraplength=320)
-directory_label.pack(pady=5)
-tk.Button(root, text="Open Last Recorded", command=open_last_recorded).pack(pady=5)
-tk.Button(root, text="Open Save Folder", command=open_save_folder).pack(pady=5)
-tk.Button(root, text="Delete Last Recorded", command=delete_last_recorded).pack(pady=5)
-tk.Button(root, text="Delete ALL Recordings", command=delete_all_recordings,
-          bg="darkred", fg="white").pack(pady=5)
-tk.Button(root, text="Settings (Change Hotkeys)", command=open_settings).pack(pady=5)
-status_label = tk.Label(root, text="Ready")
-status_label.pack(pady=10)
-
-# Update region label on startup
-update_region_label()
-
-# Bind events
-root.bind("<Unmap>", on_minimize)
-root.protocol("WM_DELETE_WINDOW", on_close)
-
-# Register hotkeys
-keyboard.add_hotkey(hotkey, toggle_recording)
-keyboard.add_hotkey(window_toggle_key, toggle_window_visibility)
-
-# Start system tray
-tray_icon = setup_tray()
-
-# Print startup info
-print(f"[+] Screen Recorder started!")
-print(f"[+] Press {hotkey.upper()} to start/stop recording")
-print(f"[+] Press {window_toggle_key.upper()} to hide/show window")
-print(f"[+] Replace mode: {'ON' if replace_mode else 'OFF'}")
-print(f"[+] Cursor visibility: {'ON' if show_cursor else 'OFF'}")
-if selected_monitor is not None:
-    monitors = get_monitors()
-    if selected_monitor < len(monitors):
-        monitor = monitors[selected_monitor][1]
-        print(f"[+] Recording screen {selected_monitor+1}: {monitor['width']}x{monitor['height']} at ({monitor['left']},{monitor['top']})")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simple Screen Recorder")
+    parser.add_argument("--jobs", help="run the recording jobs in this JSON job file after startup")
+    args = parser.parse_args()
+
+    # Print available monitors for debugging
+    with mss.mss() as sct:
+        for i, mon in enumerate(sct.monitors[1:], 1):
+            print(f"Screen {i}: {mon['width']}x{mon['height']} at ({mon['left']},{mon['top']})")
+
+    # GUI Setup
+    root = tk.Tk()
+    root.title("Simple Screen Recorder")
+    root.geometry("380x850")
+    root.resizable(False, False)
+
+    # Load configuration
+    saved_path, saved_replace_mode, saved_record_region, saved_selected_monitor, saved_show_cursor = load_config()
+    save_path = saved_path
+    save_path.mkdir(parents=True, exist_ok=True)
+    replace_mode = saved_replace_mode
+    record_region = saved_record_region
+    selected_monitor = saved_selected_monitor
+    show_cursor = saved_show_cursor
+    encoder_probe = load_encoder_probe()
+    output_mode, hls_segment_seconds, hls_window_segments, hls_keep_all = load_output_settings()
+    renditions_enabled, renditions = load_rendition_settings()
+    capture_process = load_capture_process_setting()
+    follow_cursor, follow_size, follow_dead_zone, follow_easing = load_follow_settings()
+
+    # GUI Elements
+    info_frame = tk.Frame(root, bg='lightgray', relief='sunken', bd=1)
+    info_frame.pack(fill='x', pady=(5, 10))
+    tk.Label(info_frame, text=f"Hotkeys: {hotkey.upper()} = Record | {window_toggle_key.upper()} = Hide/Show",
+             bg='lightgray', font=('Arial', 8)).pack(pady=3)
+    tk.Label(root, text="Duration:").pack(pady=(10, 2))
+    duration_entry = tk.Entry(root, width=10)
+    duration_entry.pack()
+    duration_entry.insert(0, "10")
+    duration_unit = tk.StringVar(value="Seconds")
+    tk.OptionMenu(root, duration_unit, "Seconds", "Minutes", "Hours").pack(pady=5)
+    region_frame = tk.Frame(root, bg='lightyellow', relief='ridge', bd=2)
+    region_frame.pack(fill='x', padx=10, pady=5)
+    tk.Label(region_frame, text="📹 Recording Region", bg='lightyellow',
+             font=('Arial', 10, 'bold')).pack(pady=(5, 2))
+    region_label = tk.Label(region_frame, text="Region: Full Screen (auto)",
+                           bg='lightyellow', font=('Arial', 9), wraplength=320)
+    region_label.pack(pady=2)
+    region_btn_frame = tk.Frame(region_frame, bg='lightyellow')
+    region_btn_frame.pack(pady=(2, 5))
+    tk.Button(region_btn_frame, text="🎯 Select Region", command=select_region,
+              bg="lightgreen", font=('Arial', 8)).pack(side='left', padx=2)
+    tk.Button(region_btn_frame, text="❌ Clear Region", command=clear_region,
+              bg="lightcoral", font=('Arial', 8)).pack(side='left', padx=2)
+    tk.Button(region_btn_frame, text="🖥️ Select Screen", command=select_monitor_dialog,
+              bg="lightblue", font=('Arial', 8)).pack(side='left', padx=2)
+    region_btn_frame = tk.Frame(region_frame, bg='lightyellow')
+    region_btn_frame.pack(pady=(2, 5))
+    tk.Button(region_btn_frame, text="Start Recording", command=start_recording,
+              bg="lightgreen", font=('Arial', 8)).pack(side='left', padx=5)
+    tk.Button(region_btn_frame, text="Stop Recording", command=stop_recording,
+              bg="lightcoral", font=('Arial', 8)).pack(side='right', padx=5)
+    cursor_toggle_btn = tk.Button(root, text=f"🖱️ Cursor: {'ON' if show_cursor else 'OFF'}",
+                                 command=toggle_cursor,
+                                 bg="green" if show_cursor else "red",
+                                 fg="white" if show_cursor else "black",
+                                 font=('Arial', 9, 'bold'))
+    cursor_toggle_btn.pack(pady=5)
+    tk.Button(root, text="👁️ Toggle Preview", command=start_preview,
+             bg="lightblue", font=('Arial', 9, 'bold')).pack(pady=5)
+    replace_toggle_btn = tk.Button(root, text=f"📁 Replace Mode: {'ON' if replace_mode else 'OFF'}",
+                                  command=toggle_replace_mode,
+                                  bg="green" if replace_mode else "red",
+                                  fg="white" if replace_mode else "black",
+                                  font=('Arial', 9, 'bold'))
+    replace_toggle_btn.pack(pady=5)
+    output_toggle_btn = tk.Button(root, text=f"📡 Output: {'HLS Live' if output_mode == 'hls' else 'MP4 File'}",
+                                  command=toggle_output_mode,
+                                  bg="green" if output_mode == "hls" else "lightgray",
+                                  font=('Arial', 9, 'bold'))
+    output_toggle_btn.pack(pady=5)
+    renditions_toggle_btn = tk.Button(root, text=f"🎞️ Share Copies: {'ON' if renditions_enabled else 'OFF'}",
+                                      command=toggle_renditions,
+                                      bg="green" if renditions_enabled else "lightgray",
+                                      font=('Arial', 9, 'bold'))
+    renditions_toggle_btn.pack(pady=5)
+    capture_toggle_btn = tk.Button(root, text=f"⚙️ Capture: {'Process' if capture_process else 'Thread'}",
+                                   command=toggle_capture_process,
+                                   bg="green" if capture_process else "lightgray",
+                                   font=('Arial', 9, 'bold'))
+    capture_toggle_btn.pack(pady=5)
+    follow_toggle_btn = tk.Button(root, text=f"🔍 Follow Cursor: {'ON' if follow_cursor else 'OFF'}",
+                                  command=toggle_follow_cursor,
+                                  bg="green" if follow_cursor else "lightgray",
+                                  font=('Arial', 9, 'bold'))
+    follow_toggle_btn.pack(pady=5)
+    tk.Button(root, text="Choose Save Folder", command=browse_folder).pack(pady=5)
+    directory_label = tk.Label(root, text=f"Save to:\n{save_path}", wraplength=320)
+    directory_label.pack(pady=5)
+    tk.Button(root, text="Open Last Recorded", command=open_last_recorded).pack(pady=5)
+    tk.Button(root, text="Open Save Folder", command=open_save_folder).pack(pady=5)
+    tk.Button(root, text="Delete Last Recorded", command=delete_last_recorded).pack(pady=5)
+    tk.Button(root, text="Delete ALL Recordings", command=delete_all_recordings,
+              bg="darkred", fg="white").pack(pady=5)
+    tk.Button(root, text="📋 Run Job File", command=start_job_file).pack(pady=5)
+    tk.Button(root, text="Settings (Change Hotkeys)", command=open_settings).pack(pady=5)
+    status_label = tk.Label(root, text="Ready")
+    status_label.pack(pady=10)
+
+    # Update region label on startup
+    update_region_label()
+
+    # Drain engine-to-UI events on the Tk thread
+    root.after(UI_DRAIN_INTERVAL_MS, drain_ui_events)
+
+    # Bind events
+    root.bind("<Unmap>", on_minimize)
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
+    # Register hotkeys
+    keyboard.add_hotkey(hotkey, toggle_recording)
+    keyboard.add_hotkey(window_toggle_key, toggle_window_visibility)
+
+    # Start system tray
+    tray_icon = setup_tray()
+
+    # Probe encoders in the background on first run for the current capture area (or follow viewport)
+    try:
+        _, _, probe_width, probe_height = get_capture_area()
+        if follow_cursor:
+            probe_width, probe_height = min(probe_width, follow_size[0]), min(probe_height, follow_size[1])
+        if probe_key(probe_width, probe_height, 30) not in encoder_probe:
+            threading.Thread(target=select_encoder, args=(probe_width, probe_height, 30), daemon=True).start()
+    except Exception as e:
+        print(f"[-] Skipping startup encoder probe: {e}")
+
+    # Print startup info
+    print(f"[+] Screen Recorder started!")
+    print(f"[+] Press {hotkey.upper()} to start/stop recording")
+    print(f"[+] Press {window_toggle_key.upper()} to hide/show window")
+    print(f"[+] Replace mode: {'ON' if replace_mode else 'OFF'}")
+    print(f"[+] Cursor visibility: {'ON' if show_cursor else 'OFF'}")
+    print(f"[+] Output mode: {output_mode}")
+    print(f"[+] Share copies: {'ON' if renditions_enabled else 'OFF'}")
+    print(f"[+] Capture mode: {'process' if capture_process else 'thread'}")
+    print(f"[+] Follow cursor: {'ON' if follow_cursor else 'OFF'}")
+    if selected_monitor is not None:
+        monitors = get_monitors()
+        if selected_monitor < len(monitors):
+            monitor = monitors[selected_monitor][1]
+            print(f"[+] Recording screen {selected_monitor+1}: {monitor['width']}x{monitor['height']} at ({monitor['left']},{monitor['top']})")
+        else:
+            print(f"[-] Invalid screen {selected_monitor+1}, using primary screen")
+    elif record_region:
+        x, y, w, h = record_region
+        print(f"[+] Recording region: {w}x{h} at ({x},{y})")
     else:
-        print(f"[-] Invalid screen {selected_monitor+1}, using primary screen")
-elif record_region:
-    x, y, w, h = record_region
-    print(f"[+] Recording region: {w}x{h} at ({x},{y})")
-else:
-    print(f"[+] Recording: Primary screen")
-
-root.mainloop()
+        print(f"[+] Recording: Primary screen")
+
+    if args.jobs:
+        root.after(1000, lambda: start_job_file(args.jobs))
+
+    root.mainloop()